@@ -5,6 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Tuple
 
+import numpy as np
+
+from core.bbox_ops import xywhn_to_xyxy, xyxy_to_xywhn
+
 
 @dataclass
 class BoundingBox:
@@ -39,3 +43,33 @@ class Annotation:
 
     def clear(self) -> None:
         self.boxes.clear()
+
+    def replace_boxes(self, boxes: List[BoundingBox]) -> None:
+        """Adopt ``boxes`` as this annotation's list (by reference, not copied)."""
+        self.boxes = boxes
+
+    @classmethod
+    def from_arrays(cls, class_ids: np.ndarray, xyxy: np.ndarray) -> Annotation:
+        """Build an annotation from parallel class id and (N, 4) pixel xyxy arrays."""
+        return cls([
+            BoundingBox(class_id, x1, y1, x2, y2)
+            for class_id, (x1, y1, x2, y2) in zip(
+                np.asarray(class_ids).astype(int).tolist(), np.asarray(xyxy).tolist()
+            )
+        ])
+
+    @classmethod
+    def from_yolo(cls, rows: np.ndarray, img_w: float, img_h: float) -> Annotation:
+        """Build an annotation from (N, 5) normalized YOLO rows of an ``img_w`` x ``img_h`` image."""
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, 5)
+        return cls.from_arrays(rows[:, 0], xywhn_to_xyxy(rows[:, 1:5], img_w, img_h))
+
+    def to_yolo(self, img_w: float, img_h: float) -> np.ndarray:
+        """Return an (N, 5) array of (class_id, x_center, y_center, width, height) normalized to [0,1]."""
+        boxes = np.array(
+            [(b.class_id, b.x1, b.y1, b.x2, b.y2) for b in self.boxes], dtype=np.float64
+        ).reshape(-1, 5)
+        out = np.empty_like(boxes)
+        out[:, 0] = boxes[:, 0]
+        xyxy_to_xywhn(boxes[:, 1:], 1.0 / img_w, 1.0 / img_h, out=out[:, 1:])
+        return out
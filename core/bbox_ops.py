@@ -0,0 +1,46 @@
+"""Vectorized bounding box coordinate conversions.
+
+All functions operate on whole (N, 4) arrays at once so converting every box
+of an image costs a handful of NumPy calls rather than a Python loop.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+
+def xyxy_to_xywhn(
+    xyxy: np.ndarray, inv_w: float, inv_h: float, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Convert pixel (x1, y1, x2, y2) boxes to normalized (x_center, y_center, w, h).
+
+    ``inv_w``/``inv_h`` are the reciprocal image width and height. ``out``
+    may be a preallocated (N, 4) array to write into.
+    """
+    xyxy = np.asarray(xyxy).reshape(-1, 4)
+    if out is None:
+        out = np.empty(xyxy.shape, dtype=np.result_type(xyxy.dtype, np.float32))
+    x1, y1, x2, y2 = xyxy[:, 0], xyxy[:, 1], xyxy[:, 2], xyxy[:, 3]
+    np.multiply(x1 + x2, 0.5 * inv_w, out=out[:, 0])
+    np.multiply(y1 + y2, 0.5 * inv_h, out=out[:, 1])
+    np.multiply(x2 - x1, inv_w, out=out[:, 2])
+    np.multiply(y2 - y1, inv_h, out=out[:, 3])
+    return out
+
+
+def xywhn_to_xyxy(
+    xywhn: np.ndarray, width: float, height: float, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Convert normalized (x_center, y_center, w, h) boxes to pixel (x1, y1, x2, y2)."""
+    xywhn = np.asarray(xywhn, dtype=np.float64).reshape(-1, 4)
+    if out is None:
+        out = np.empty(xywhn.shape, dtype=np.float64)
+    box_w = xywhn[:, 2] * width
+    box_h = xywhn[:, 3] * height
+    np.subtract(xywhn[:, 0] * width, box_w * 0.5, out=out[:, 0])
+    np.subtract(xywhn[:, 1] * height, box_h * 0.5, out=out[:, 1])
+    np.add(out[:, 0], box_w, out=out[:, 2])
+    np.add(out[:, 1], box_h, out=out[:, 3])
+    return out
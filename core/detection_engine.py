@@ -6,11 +6,17 @@ conversion to a unified format.
 """
 from __future__ import annotations
 
+import functools
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import logging
 
+import numpy as np
+
+# a path on disk or a BGR frame already decoded by read_image()
+ImageSource = Union[Path, np.ndarray]
+
 
 class DetectionResult:
     """Represents a single detection output."""
@@ -38,10 +44,14 @@ class DetectionResult:
 class DetectionEngine:
     """Wrapper around the Ultralytics YOLO model for inference."""
 
-    def __init__(self, weights_path: Path, confidence: float = 0.25):
+    def __init__(self, weights_path: Path, confidence: float = 0.25, device: str | None = None):
         self.weights_path = weights_path
         self.confidence = confidence
         self.model = None  # type: ignore
+        # None means probe for CUDA when the model is loaded
+        self.device: str | None = device
+        # FP16 inference is only enabled on CUDA; CPUs emulate half precision slowly
+        self._half = False
 
     def load_model(self) -> None:
         """Load the YOLO model with GPU if available."""
@@ -53,38 +63,117 @@ class DetectionEngine:
             raise RuntimeError(msg) from e
 
         try:
-            device = "cuda" if self._cuda_available() else "cpu"
+            device = self.device or ("cuda" if _cuda_available() else "cpu")
             logging.info(f"Loading YOLO model from {self.weights_path} on device {device}")
             self.model = YOLO(str(self.weights_path))
             self.model.fuse()  # optional optimizations
             self.model.to(device)
+            self.device = device
+            self._half = device.startswith("cuda")
             logging.info("Model loaded successfully")
         except Exception as e:
             msg = f"Failed to load YOLO model: {str(e)}"
             logging.error(msg)
             raise RuntimeError(msg) from e
 
-    def _cuda_available(self) -> bool:
-        try:
-            import torch
-            return torch.cuda.is_available()
-        except ImportError:
-            return False
+    def _predict(self, sources: Sequence[ImageSource]) -> Iterator:
+        """Run the model on ``sources`` as a single batch.
 
-    def infer_image(self, image_path: Path) -> Iterable[DetectionResult]:
-        """Run inference on a single image and yield results."""
+        Sources may be paths or frames already decoded by :func:`read_image`;
+        passing frames lets callers decode the next batch while this one runs.
+
+        Results are streamed one image at a time so Ultralytics can reuse its
+        buffers instead of materializing the whole batch before returning.
+
+        With FP16 enabled, scores can differ from FP32 by roughly 1e-3, so a
+        detection sitting exactly on the confidence threshold may flip either
+        way; everything else is unaffected.
+        """
         if self.model is None:
             raise RuntimeError("Model not loaded")
+        return self.model.predict(
+            [s if isinstance(s, np.ndarray) else str(s) for s in sources],
+            conf=self.confidence,
+            imgsz=1280,
+            device=self.device,
+            half=self._half,
+            batch=len(sources),
+            stream=True,
+            verbose=False,
+        )
+
+    def infer_image(self, image_path: Path) -> Iterable[DetectionResult]:
+        """Run inference on a single image and yield results."""
+        _, detections = self.infer_batch([image_path])[0]
+        yield from detections
 
-        results = self.model(str(image_path), conf=self.confidence, imgsz=1280)
+    def infer_batch(
+        self, sources: Sequence[ImageSource]
+    ) -> List[Tuple[Tuple[int, int], List[DetectionResult]]]:
+        """Run inference on several images in one forward pass.
+
+        Returns one ``((width, height), detections)`` pair per input, in
+        the same order. The size comes from the decoded frame the model saw,
+        so callers don't need to open the image again to normalize boxes.
+        """
+        results = self._predict(sources)
+        batch: List[Tuple[Tuple[int, int], List[DetectionResult]]] = []
         for r in results:
-            for box in r.boxes:
-                class_id = int(box.cls.item())
-                conf = float(box.conf.item())
-                # xyxy format: [x1, y1, x2, y2]
-                coords = box.xyxy[0].tolist()
-                x1, y1, x2, y2 = coords[0], coords[1], coords[2], coords[3]
-                yield DetectionResult(class_id, conf, (x1, y1, x2, y2))
+            height, width = r.orig_shape
+            # one host copy per tensor instead of an .item() sync per box and field
+            classes = r.boxes.cls.cpu().numpy().astype(np.int32).tolist()
+            confs = r.boxes.conf.cpu().numpy().tolist()
+            # xyxy format: [x1, y1, x2, y2]
+            coords = r.boxes.xyxy.cpu().numpy().tolist()
+            detections = [
+                DetectionResult(class_id, conf, tuple(xyxy))
+                for class_id, conf, xyxy in zip(classes, confs, coords)
+            ]
+            batch.append(((width, height), detections))
+        return batch
+
+    def infer_batch_yolo(self, sources: Sequence[ImageSource]) -> List[np.ndarray]:
+        """Run batched inference and return normalized YOLO rows per image.
+
+        Each array has shape (N, 5) with columns (class_id, x_center,
+        y_center, width, height). The conversion runs as one tensor op on the
+        model's device and is copied to host once per image rather than once
+        per box.
+        """
+        return list(self.iter_batch_yolo(sources))
+
+    def iter_batch_yolo(self, sources: Sequence[ImageSource]) -> Iterator[np.ndarray]:
+        """Like :meth:`infer_batch_yolo` but yield each image's rows as soon as they are ready."""
+        for r in self._predict(sources):
+            classes = r.boxes.cls.cpu().numpy()
+            xywhn = r.boxes.xywhn.cpu().numpy()
+            yield np.column_stack((classes, xywhn)).astype(np.float32, copy=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _cuda_available() -> bool:
+    """Probe for CUDA once per process; driver initialization can be slow."""
+    try:
+        import torch
+        return torch.cuda.is_available()
+    except ImportError:
+        return False
+
+
+def read_image(image_path: Path) -> Optional[np.ndarray]:
+    """Decode an image to a BGR array the way Ultralytics would, or None on failure.
+
+    ``cv2.imdecode`` on raw bytes is used instead of ``cv2.imread`` so
+    non-ASCII paths work on Windows. OpenCV releases the GIL while decoding,
+    so this can run on worker threads alongside inference.
+    """
+    import cv2
+
+    try:
+        data = np.fromfile(str(image_path), dtype=np.uint8)
+    except OSError:
+        return None
+    return cv2.imdecode(data, cv2.IMREAD_COLOR)
 
 
 # additional helper functions could go here
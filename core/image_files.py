@@ -0,0 +1,40 @@
+"""Helpers for locating image files inside a dataset folder."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+IMAGE_EXTENSIONS: Tuple[str, ...] = (".jpg", ".jpeg", ".png")
+
+
+def list_images(folder: Path, extensions: Tuple[str, ...] = IMAGE_EXTENSIONS) -> List[Path]:
+    """Return the image files directly inside ``folder`` sorted by name.
+
+    The folder is read in a single ``os.scandir`` pass and extensions are
+    matched case-insensitively, so ``IMG_001.JPG`` is picked up as well.
+    """
+    with os.scandir(folder) as it:
+        names = [
+            entry.name
+            for entry in it
+            if entry.name.lower().endswith(extensions) and entry.is_file()
+        ]
+    names.sort()
+    return [folder / name for name in names]
+
+
+def read_image_size(image_path: Path) -> Optional[Tuple[int, int]]:
+    """Return ``(width, height)`` of an image without decoding its pixels.
+
+    PIL only parses the file header until pixel data is requested, so this is
+    cheap even for large JPEGs. Returns None if the file can't be identified.
+    """
+    from PIL import Image
+
+    try:
+        with Image.open(image_path) as im:
+            return im.size
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+_ROW_FORMAT = "%d %.6f %.6f %.6f %.6f\n"
 
 
 def read_yolo_labels(label_path: Path) -> List[Tuple[int, float, float, float, float]]:
@@ -12,22 +17,56 @@ def read_yolo_labels(label_path: Path) -> List[Tuple[int, float, float, float, f
     Each entry is (class_id, x_center, y_center, width, height) with values in
     normalized [0,1] coordinates.
     """
+    arr = read_yolo_labels_array(label_path)
+    return [(int(row[0]), row[1], row[2], row[3], row[4]) for row in arr.tolist()]
+
+
+def read_yolo_labels_array(label_path: Path) -> np.ndarray:
+    """Read a YOLO label file into an (N, 5) float array.
+
+    Columns are (class_id, x_center, y_center, width, height); an empty file
+    gives a (0, 5) array.
+    """
+    text = label_path.read_text()
+    if not text.strip():
+        return np.zeros((0, 5), dtype=np.float64)
+    try:
+        # parse the whole file in one C loop; extra columns are ignored
+        return np.loadtxt(io.StringIO(text), dtype=np.float64, usecols=range(5), ndmin=2)
+    except ValueError:
+        # short or malformed rows: fall back to the tolerant line parser
+        entries = _parse_label_lines(text.splitlines())
+        return np.array(entries, dtype=np.float64).reshape(-1, 5)
+
+
+def _parse_label_lines(lines: Iterable[str]) -> List[Tuple[int, float, float, float, float]]:
+    """Parse label lines one by one, skipping blank or incomplete rows."""
     entries: List[Tuple[int, float, float, float, float]] = []
-    with label_path.open("r") as f:
-        for line in f:
-            parts = line.strip().split()
-            if not parts:
-                continue
-            if len(parts) < 5:
-                continue
-            class_id = int(parts[0])
-            coords = tuple(float(x) for x in parts[1:5])
-            entries.append((class_id, *coords))
+    for line in lines:
+        parts = line.strip().split()
+        if not parts:
+            continue
+        if len(parts) < 5:
+            continue
+        class_id = int(parts[0])
+        coords = tuple(float(x) for x in parts[1:5])
+        entries.append((class_id, *coords))
     return entries
 
 
-def write_yolo_labels(label_path: Path, entries: List[Tuple[int, float, float, float, float]]) -> None:
-    """Write a list of YOLO label entries to a file, overwriting if necessary."""
+def write_yolo_labels(label_path: Path, entries: Sequence[Sequence[float]]) -> None:
+    """Write a list of YOLO label entries to a file, overwriting if necessary.
+
+    Each entry is (class_id, x_center, y_center, width, height); any sequence
+    works, including rows from ``ndarray.tolist()``. Coordinates are written
+    with six decimals, the usual YOLO convention, and the whole file goes out
+    in a single write.
+    """
+    lines = [_ROW_FORMAT % tuple(entry) for entry in entries]
     with label_path.open("w") as f:
-        for entry in entries:
-            f.write(" ".join(str(x) for x in entry) + "\n")
+        f.write("".join(lines))
+
+
+def write_yolo_labels_array(label_path: Path, arr: np.ndarray) -> None:
+    """Write an (N, 5) array of YOLO rows to a file, overwriting if necessary."""
+    write_yolo_labels(label_path, np.asarray(arr, dtype=np.float64).reshape(-1, 5).tolist())
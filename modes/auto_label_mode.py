@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import logging
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
-from core.detection_engine import DetectionEngine, DetectionResult
-from core.yolo_label_parser import write_yolo_labels
+from core.detection_engine import DetectionEngine, read_image
+from core.image_files import list_images, read_image_size
+from core.yolo_label_parser import write_yolo_labels_array
 
 
 class AutoLabelMode(QtWidgets.QWidget):
@@ -64,10 +67,18 @@ class AutoLabelMode(QtWidgets.QWidget):
         self._weights_button.clicked.connect(self._choose_weights_file)
         self._output_dir_button.clicked.connect(self._choose_output_dir)
         self._start_button.clicked.connect(self._on_start_clicked)
+        # connected once here; connecting per run would stack duplicate slots
+        self.progress_updated.connect(self._progress.setValue)
+        self.finished.connect(self._on_finished)
+        self.error.connect(self._on_error)
 
         # internal state
+        # the loaded model is kept between runs so re-running with a different
+        # threshold does not reload the weights; keyed on path + mtime
         self.engine: DetectionEngine | None = None
+        self._engine_key: tuple[Path, int] | None = None
         self._thread: QtCore.QThread | None = None
+        self._worker: _AutoLabelWorker | None = None
 
         # keep track of widgets we should disable while worker runs
         self._run_controls = [
@@ -133,10 +144,15 @@ class AutoLabelMode(QtWidgets.QWidget):
         # prepare UI state
         self._progress.setValue(0)
         self._set_controls_enabled(False)
-        print("[AutoLabelMode] starting worker thread")
+        logging.debug("[AutoLabelMode] starting worker thread")
+
+        engine_key = (weights.resolve(), weights.stat().st_mtime_ns)
+        if self.engine is None or self._engine_key != engine_key:
+            self.engine = DetectionEngine(weights, conf)
+            self._engine_key = engine_key
 
         # create worker thread and keep references so they are not GC'd
-        self._worker = _AutoLabelWorker(images_dir, output_dir, weights, conf)
+        self._worker = _AutoLabelWorker(images_dir, output_dir, self.engine, conf)
         self._thread = QtCore.QThread()
         self._worker.moveToThread(self._thread)
 
@@ -144,38 +160,39 @@ class AutoLabelMode(QtWidgets.QWidget):
         self._worker.progress_updated.connect(self.progress_updated)
         self._worker.finished.connect(self.finished)
         self._worker.error.connect(self.error)
-        self.progress_updated.connect(self._progress.setValue)
-        self.finished.connect(self._on_finished)
-        self.error.connect(self._on_error)
 
         self._thread.started.connect(self._worker.run)
-        # cleanup when thread ends
+        # cleanup when thread ends; the worker's C++ half goes with it
+        self._thread.finished.connect(self._worker.deleteLater)
         self._thread.finished.connect(self._on_thread_finished)
         self._thread.start()
-        print("[AutoLabelMode] thread started")
+        logging.debug("[AutoLabelMode] thread started")
 
     def _on_finished(self) -> None:
-        print("[AutoLabelMode] received finished signal")
+        logging.debug("[AutoLabelMode] received finished signal")
         QtWidgets.QMessageBox.information(self, "Done", "Auto labeling finished.")
         self._set_controls_enabled(True)
-        if self._thread:
-            self._thread.quit()
-            self._thread.wait()
-            self._thread = None
-        self._worker = None
+        self._release_worker()
 
     def _on_error(self, msg: str) -> None:
-        print(f"[AutoLabelMode] received error signal: {msg}")
+        logging.debug("[AutoLabelMode] received error signal: %s", msg)
         QtWidgets.QMessageBox.critical(self, "Error", msg)
         self._set_controls_enabled(True)
+        self._release_worker()
+
+    def _release_worker(self) -> None:
+        """Stop the worker thread and let Qt free the thread and worker objects."""
         if self._thread:
             self._thread.quit()
             self._thread.wait()
+            # _on_thread_finished runs after this reference is cleared, so
+            # schedule the deletion here
+            self._thread.deleteLater()
             self._thread = None
         self._worker = None
 
     def _on_thread_finished(self) -> None:
-        print("[AutoLabelMode] thread finished cleanup")
+        logging.debug("[AutoLabelMode] thread finished cleanup")
         # called when QThread emits finished; ensure references are cleared
         if self._thread:
             self._thread.deleteLater()
@@ -190,6 +207,15 @@ class AutoLabelMode(QtWidgets.QWidget):
         super().closeEvent(event)
 
 
+def _batch_sort_key(image_path: Path) -> tuple[float, int]:
+    """Order images by aspect ratio bucket, then by longest side."""
+    size = read_image_size(image_path)
+    if size is None or not size[1]:
+        return (0.0, 0)
+    width, height = size
+    return (round(width / height, 1), max(width, height))
+
+
 class _AutoLabelWorker(QtCore.QObject):
     progress_updated = QtCore.pyqtSignal(int)
     finished = QtCore.pyqtSignal()
@@ -199,75 +225,112 @@ class _AutoLabelWorker(QtCore.QObject):
         self,
         image_dir: Path,
         output_dir: Path,
-        weights: Path,
+        engine: DetectionEngine,
         confidence: float,
+        batch_size: int = 16,
+        write_workers: int = 4,
+        decode_workers: int = 4,
     ):
         super().__init__()
         self.image_dir = image_dir
         self.output_dir = output_dir
-        self.weights = weights
+        self.engine = engine
         self.confidence = confidence
+        self.batch_size = max(1, batch_size)
+        self.write_workers = max(1, write_workers)
+        self.decode_workers = max(1, decode_workers)
 
     def run(self) -> None:
         try:
             # Collect images first
-            images = (
-                sorted(self.image_dir.glob("*.jpg"))
-                + sorted(self.image_dir.glob("*.png"))
-                + sorted(self.image_dir.glob("*.jpeg"))
-            )
+            images = list_images(self.image_dir)
             
             total = len(images)
             if total == 0:
                 self.error.emit("No images found in the selected folder.")
                 return
+            # a batch is letterboxed to its largest member; keeping similar
+            # shapes together avoids spending the forward pass on padding
+            images.sort(key=_batch_sort_key)
 
             # Emit 0% as we start loading model
             self.progress_updated.emit(0)
 
-            # Load model (this may take time)
-            engine = DetectionEngine(self.weights, self.confidence)
-            engine.load_model()
+            # Load model unless a previous run already did (this may take time)
+            engine = self.engine
+            engine.confidence = self.confidence
+            if engine.model is None:
+                engine.load_model()
 
             # Emit 5% once model is loaded
             self.progress_updated.emit(5)
 
-            from PIL import Image
-
-            # Process each image
-            for i, img_path in enumerate(images, start=1):
-                try:
-                    # Run inference
-                    results = list(engine.infer_image(img_path))
-                    entries: List[tuple] = []
-
-                    # Get image dimensions for normalization
-                    with Image.open(img_path) as im:
-                        width, height = im.size
-
-                    # Convert detections to YOLO format
-                    for r in results:
-                        class_id, x_center, y_center, w_norm, h_norm = r.to_yolo_format((width, height))
-                        entries.append((class_id, x_center, y_center, w_norm, h_norm))
-
-                    # Write label file
+            # Label files are written on a small pool so disk I/O overlaps with
+            # the next batch's forward pass instead of stalling it; likewise the
+            # next batch is decoded on decode_pool while the current one runs
+            pending: list[tuple[Path, Future]] = []
+            chunks = [images[i : i + self.batch_size] for i in range(0, total, self.batch_size)]
+            with (
+                ThreadPoolExecutor(max_workers=self.write_workers) as pool,
+                ThreadPoolExecutor(max_workers=self.decode_workers) as decode_pool,
+            ):
+                def queue_write(img_path: Path, rows) -> None:
                     label_file = self.output_dir / img_path.with_suffix(".txt").name
-                    write_yolo_labels(label_file, entries)
-
-                except Exception as img_error:
-                    # Log but continue with next image
-                    import logging
+                    pending.append((img_path, pool.submit(write_yolo_labels_array, label_file, rows)))
+
+                decoding = [decode_pool.submit(read_image, p) for p in chunks[0]]
+                # Process images in batches so the model sees a real batch per forward pass
+                for n, chunk in enumerate(chunks):
+                    decoded = decoding
+                    if n + 1 < len(chunks):
+                        decoding = [decode_pool.submit(read_image, p) for p in chunks[n + 1]]
+
+                    paths: list[Path] = []
+                    frames: list = []
+                    for img_path, future in zip(chunk, decoded):
+                        frame = future.result()
+                        if frame is None:
+                            logging.warning(f"Failed to process {img_path}: could not decode image")
+                            continue
+                        paths.append(img_path)
+                        frames.append(frame)
+
+                    streamed = 0
+                    try:
+                        # each image's write is queued as soon as its result streams out
+                        if frames:
+                            for img_path, rows in zip(paths, engine.iter_batch_yolo(frames)):
+                                queue_write(img_path, rows)
+                                streamed += 1
+                    except Exception as batch_error:
+                        # one bad image shouldn't cost the rest of the batch
+                        # their labels: redo the ones not yet written singly
+                        logging.warning(
+                            f"Batch failed at {paths[streamed]}: {batch_error}; "
+                            f"retrying its {len(paths) - streamed} remaining images one by one"
+                        )
+                        for img_path, frame in zip(paths[streamed:], frames[streamed:]):
+                            try:
+                                rows = engine.infer_batch_yolo([frame])[0]
+                            except Exception as img_error:
+                                logging.warning(f"Failed to process {img_path}: {img_error}")
+                                continue
+                            queue_write(img_path, rows)
+
+                    # Update progress (5% to 100%) once per batch
+                    done = min((n + 1) * self.batch_size, total)
+                    progress_pct = 5 + int((done / total) * 95)
+                    self.progress_updated.emit(progress_pct)
+
+            # pool shutdown waited for every write; log failures but keep going
+            for img_path, future in pending:
+                img_error = future.exception()
+                if img_error is not None:
                     logging.warning(f"Failed to process {img_path}: {img_error}")
-                    continue
-
-                # Update progress (5% to 100%)
-                progress_pct = 5 + int((i / total) * 95)
-                self.progress_updated.emit(progress_pct)
 
             self.progress_updated.emit(100)
             self.finished.emit()
 
         except Exception as e:
-            import traceback
             self.error.emit(f"Auto-labeling failed: {str(e)}\n{traceback.format_exc()}")
 
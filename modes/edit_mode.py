@@ -2,16 +2,56 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, List, Optional
 
+import numpy as np
 from PyQt6 import QtCore, QtGui, QtWidgets
 
-from ui.canvas_widget import CanvasWidget, CanvasMode
+from ui.canvas_widget import CanvasWidget, CanvasMode, prepare_for_display
 from ui.control_panel import ControlPanel
+from ui.image_prefetch import ImagePrefetcher
+from ui.list_models import BoxListModel, SavedListModel
 
-from core.bbox_model import Annotation, BoundingBox
-from core.yolo_label_parser import read_yolo_labels, write_yolo_labels
+from core.bbox_model import Annotation
+from core.image_files import list_images, read_image_size
+from core.yolo_label_parser import read_yolo_labels_array, write_yolo_labels_array
+
+
+@dataclass
+class ImageState:
+    """In-memory annotation of one image and whether it has unsaved edits."""
+    annotation: Annotation
+    dirty: bool = False
+
+
+class _DeleteSignals(QtCore.QObject):
+    # image path, whether the image file is gone
+    finished = QtCore.pyqtSignal(object, bool)
+
+
+class _DeleteFilesTask(QtCore.QRunnable):
+    """Removes an image and its label file on a pool thread."""
+
+    def __init__(self, signals: _DeleteSignals, img_path: Path, label_path: Path):
+        super().__init__()
+        self._signals = signals
+        self._img_path = img_path
+        self._label_path = label_path
+
+    def run(self) -> None:
+        try:
+            self._img_path.unlink(missing_ok=True)
+        except OSError:
+            # the image is restored in the list, so it keeps its labels
+            self._signals.finished.emit(self._img_path, False)
+            return
+        try:
+            self._label_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        self._signals.finished.emit(self._img_path, True)
 
 
 class EditMode(QtWidgets.QWidget):
@@ -117,6 +157,8 @@ class EditMode(QtWidgets.QWidget):
         self.goto_button = QtWidgets.QPushButton("Git")
         self.goto_button.setEnabled(False)
         jump_row.addWidget(self.goto_button)
+        # image count the spinbox range was last set for (0 = no images)
+        self._goto_range_max = 0
         left_layout.addLayout(jump_row)
 
         left_layout.addSpacing(10)
@@ -125,13 +167,20 @@ class EditMode(QtWidgets.QWidget):
 
         left_layout.addSpacing(10)
         left_layout.addWidget(QtWidgets.QLabel("Kutular:"))
-        self.box_list = QtWidgets.QListWidget()
+        self.box_model = BoxListModel(self)
+        self.box_list = QtWidgets.QListView()
+        self.box_list.setModel(self.box_model)
+        # refreshes are skipped while the list is hidden and caught up on show
+        self._box_list_stale = False
+        self.box_list.installEventFilter(self)
         left_layout.addWidget(self.box_list)
 
         # saved images list below the box list
         left_layout.addSpacing(10)
         left_layout.addWidget(QtWidgets.QLabel("Kaydedilenler:"))
-        self.saved_list = QtWidgets.QListWidget()
+        self.saved_model = SavedListModel(self)
+        self.saved_list = QtWidgets.QListView()
+        self.saved_list.setModel(self.saved_model)
         left_layout.addWidget(self.saved_list)
         self.saved_count_label = QtWidgets.QLabel("Toplam: 0")
         left_layout.addWidget(self.saved_count_label)
@@ -160,14 +209,44 @@ class EditMode(QtWidgets.QWidget):
         # save button should also move to next image
         self.save_button.clicked.connect(lambda: self.save_current_annotation(True))
         self.canvas.boxes_changed.connect(self._on_boxes_changed)
+        self.canvas.selection_changed.connect(self._on_selection_changed)
         self.canvas.mode_changed.connect(self._on_canvas_mode_changed)
-        self.box_list.itemClicked.connect(self._box_list_selected)
+        self.box_list.clicked.connect(self._box_list_selected)
         self.class_spin.valueChanged.connect(lambda v: setattr(self.canvas, 'new_box_class', v))
         self.class_spin.valueChanged.connect(self._change_selected_class)
 
         # annotation store & state
-        self.annotations: dict[Path, Annotation] = {}
-        self.dirty: dict[Path, bool] = {}
+        # one entry per visited image, so a single lookup finds both the
+        # annotation and its dirty flag
+        self.image_states: dict[Path, ImageState] = {}
+        self._size_cache: dict[Path, tuple[int, int]] = {}
+        self._label_path_cache: dict[Path, Path] = {}
+        self._label_dir_edit.textChanged.connect(self._label_path_cache.clear)
+        # files are deleted on the thread pool; until a delete finishes its
+        # original list position and saved-list state are kept for undoing it
+        self._pending_deletes: dict[Path, tuple[int, bool]] = {}
+        self._delete_signals = _DeleteSignals(self)
+        self._delete_signals.finished.connect(self._on_delete_finished)
+        # neighbours of the current image are decoded in the background
+        self._prefetcher = ImagePrefetcher()
+        self._prefetch_radius = 2
+
+        # one reusable popup for short notices such as "Kaydedildi"
+        self._toast = QtWidgets.QLabel(self)
+        self._toast.setWindowFlags(QtCore.Qt.WindowType.ToolTip)
+        self._toast.setStyleSheet(
+            "background: palette(tooltip-base); color: palette(tooltip-text);"
+            " border: 1px solid palette(mid); padding: 4px 8px;"
+        )
+        self._toast.hide()
+        self._toast_timer = QtCore.QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.timeout.connect(self._toast.hide)
+
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(16)
+        self._refresh_timer.timeout.connect(self._refresh_box_list)
         self.annotation = Annotation()
         self.images: List[Path] = []
         self.current_index: int = -1
@@ -259,9 +338,13 @@ class EditMode(QtWidgets.QWidget):
 
     def _show_temporary_message(self, text: str, timeout: int = 1500) -> None:
         """Display a transient tooltip-style message at bottom-right of widget."""
+        self._toast.setText(text)
+        self._toast.adjustSize()
         # map bottom-right corner of this widget to global coords
         pos = self.mapToGlobal(self.rect().bottomRight())
-        QtWidgets.QToolTip.showText(pos, text, self, self.rect(), timeout)
+        self._toast.move(pos.x() - self._toast.width(), pos.y() - self._toast.height())
+        self._toast.show()
+        self._toast_timer.start(timeout)
 
     def _load_global_state(self) -> None:
         """Load image/label paths and last index from global state file."""
@@ -322,39 +405,49 @@ class EditMode(QtWidgets.QWidget):
         self._image_dir_edit.clear()
         self._label_dir_edit.clear()
         self.images = []
+        # deletes still running belong to the old list; don't restore them
+        self._pending_deletes.clear()
         self.current_index = -1
         self.canvas._pixmap = None
         self.canvas._boxes = []
         self.canvas._selected_box = None
         self.canvas.update()
         self.index_label.setText("0 / 0")
-        self.goto_spin.setEnabled(False)
-        self.goto_spin.setRange(1, 1)
-        self.goto_button.setEnabled(False)
+        self._sync_goto_controls()
 
         
+    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if obj is self.box_list and event.type() == QtCore.QEvent.Type.Show and self._box_list_stale:
+            self._refresh_box_list()
+        return super().eventFilter(obj, event)
+
     def _refresh_box_list(self) -> None:
-        sel_idx = -1
-        if self.canvas._selected_box in self.canvas._boxes:
-            sel_idx = self.canvas._boxes.index(self.canvas._selected_box)
-        self.box_list.clear()
-        image_size = self._current_image_size()
-        for box in self.canvas._boxes:
-            if image_size:
-                width, height = image_size
-                x_center = (box.x1 + box.x2) / 2 / width
-                y_center = (box.y1 + box.y2) / 2 / height
-                w_norm = (box.x2 - box.x1) / width
-                h_norm = (box.y2 - box.y1) / height
-                self.box_list.addItem(
-                    f"{box.class_id} {x_center:.6f} {y_center:.6f} {w_norm:.6f} {h_norm:.6f}"
-                )
-            else:
-                self.box_list.addItem(f"{box.class_id} 0.000000 0.000000 0.000000 0.000000")
-        if sel_idx >= 0 and sel_idx < self.box_list.count():
-            self.box_list.setCurrentRow(sel_idx)
-        # mark dirty because list reflects change
-        self._mark_dirty()
+        self._refresh_timer.stop()
+        if not self.box_list.isVisible():
+            # e.g. another mode's page is shown; a minimized window still
+            # counts as visible, so refreshes keep running there
+            self._box_list_stale = True
+            return
+        self._box_list_stale = False
+        # rows are formatted lazily by the model when the view paints them;
+        # edits only ever touch the selected box, so only its row is refreshed
+        self.box_model.set_boxes(self.canvas._boxes, self._current_image_size(), self.canvas._selected_box)
+        self._sync_list_selection()
+
+    def _on_selection_changed(self) -> None:
+        # nothing was edited: leave the dirty flag alone and only move the
+        # list cursor
+        if not self.box_list.isVisible():
+            self._box_list_stale = True
+            return
+        self._sync_list_selection()
+
+    def _sync_list_selection(self) -> None:
+        sel_idx = self.box_model.row_of(self.canvas._selected_box)
+        if sel_idx >= 0:
+            self.box_list.setCurrentIndex(self.box_model.index(sel_idx))
+        else:
+            self.box_list.setCurrentIndex(QtCore.QModelIndex())
 
     def _current_image_size(self) -> tuple[int, int] | None:
         if 0 <= self.current_index < len(self.images):
@@ -366,47 +459,40 @@ class EditMode(QtWidgets.QWidget):
     def _change_selected_class(self, value: int) -> None:
         if self.canvas._selected_box:
             self.canvas._selected_box.class_id = value
+            self.canvas._update_box_regions(self.canvas._selected_box)
             self.canvas.boxes_changed.emit()
 
-    def _box_list_selected(self, item: QtWidgets.QListWidgetItem) -> None:
-        idx = self.box_list.row(item)
+    def _box_list_selected(self, index: QtCore.QModelIndex) -> None:
+        idx = index.row()
         if 0 <= idx < len(self.canvas._boxes):
+            previous = self.canvas._selected_box
             self.canvas._selected_box = self.canvas._boxes[idx]
             self.class_spin.setValue(self.canvas._selected_box.class_id)
-            self.canvas.update()
+            self.canvas._update_box_regions(previous, self.canvas._selected_box)
 
     def _on_boxes_changed(self) -> None:
-        # copy canvas boxes to current annotation and mark dirty
-        if 0 <= self.current_index < len(self.images):
-            img = self.images[self.current_index]
-            ann = Annotation()
-            for b in self.canvas._boxes:
-                ann.add(b)
-            self.annotations[img] = ann
-            self.dirty[img] = True
-        self._refresh_box_list()
-
-    def _mark_dirty(self) -> None:
-        if 0 <= self.current_index < len(self.images):
-            self.dirty[self.images[self.current_index]] = True
+        # the canvas edits the annotation's own list, so only the dirty flag
+        # needs updating here
+        self._save_current_in_memory()
+        # drags emit this on every mouse move; coalesce the list refresh to
+        # at most one per frame
+        self._refresh_timer.start()
 
     def _save_current_in_memory(self) -> None:
         # called before navigation to preserve edits without writing to disk
         if 0 <= self.current_index < len(self.images):
             img = self.images[self.current_index]
-            ann = Annotation()
-            for b in self.canvas._boxes:
-                ann.add(b)
-            self.annotations[img] = ann
-            self.dirty[img] = True
+            state = self.image_states.get(img)
+            if state is None:
+                state = self.image_states[img] = ImageState(Annotation())
+            state.annotation.replace_boxes(self.canvas._boxes)
+            state.dirty = True
 
     def _add_saved_image(self, name: str) -> None:
         """Append image name to the saved-list widget and update total count."""
-        # ignore duplicates
-        existing = [self.saved_list.item(i).text() for i in range(self.saved_list.count())]
-        if name not in existing:
-            self.saved_list.addItem(name)
-            self.saved_count_label.setText(f"Toplam: {self.saved_list.count()}")
+        # the model ignores duplicates
+        if self.saved_model.add(name):
+            self.saved_count_label.setText(f"Toplam: {self.saved_model.rowCount()}")
 
     # helper methods for file dialogs are defined later in the file; the earlier
     # duplicates have been removed for clarity.
@@ -439,7 +525,7 @@ class EditMode(QtWidgets.QWidget):
         path = QtWidgets.QFileDialog.getExistingDirectory(self, "Select Image Folder")
         if path:
             self._image_dir_edit.setText(path)
-            self.saved_list.clear()
+            self.saved_model.clear()
             self.saved_count_label.setText("Toplam: 0")
             self.load_images(Path(path))
             self._save_global_state()
@@ -464,19 +550,16 @@ class EditMode(QtWidgets.QWidget):
             self._set_mode(CanvasMode.NAVIGATE)
 
     def load_images(self, folder: Path) -> None:
-        self.images = sorted(folder.glob("*.jpg")) + sorted(folder.glob("*.png")) + sorted(
-            folder.glob("*.jpeg")
-        )
+        self.images = list_images(folder)
+        # sizes are re-read for a freshly opened folder in case files changed
+        self._size_cache.clear()
+        self._label_path_cache.clear()
+        self._prefetcher.clear()
+        # deletes still running belong to the old list; don't restore them
+        self._pending_deletes.clear()
         self.current_index = 0 if self.images else -1
         # enable/adjust goto controls
-        if self.images:
-            self.goto_spin.setEnabled(True)
-            self.goto_spin.setRange(1, len(self.images))
-            self.goto_button.setEnabled(True)
-        else:
-            self.goto_spin.setEnabled(False)
-            self.goto_spin.setRange(1, 1)
-            self.goto_button.setEnabled(False)
+        self._sync_goto_controls()
         # after loading images we may update global state (paths, index)
         self._save_global_state()
         self._load_current()
@@ -485,33 +568,84 @@ class EditMode(QtWidgets.QWidget):
         if self.current_index < 0 or self.current_index >= len(self.images):
             return
         img_path = self.images[self.current_index]
+        label_path = self._label_path_for(img_path)
+        image, rows = self._prefetcher.get(img_path, label_path)
+        if image is None:
+            # not prefetched (e.g. a jump): decode it here and keep it in the
+            # prefetch cache so coming back to it is instant
+            image = QtGui.QImage(str(img_path))
+            if not image.isNull():
+                image = prepare_for_display(image)
+                self._prefetcher.put(img_path, label_path, image)
+        if not image.isNull():
+            self._size_cache.setdefault(img_path, (image.width(), image.height()))
         # if annotation already in memory, reuse; otherwise read from disk
-        if img_path in self.annotations:
-            self.annotation = self.annotations[img_path]
+        state = self.image_states.get(img_path)
+        if state is not None:
+            self.annotation = state.annotation
         else:
-            self._load_annotation_for(img_path)
-            self.annotations[img_path] = self.annotation
-        self.dirty.setdefault(img_path, False)
+            self._load_annotation_for(img_path, rows)
+            self.image_states[img_path] = ImageState(self.annotation)
         # update canvas
-        self.canvas.load_image(img_path)
-        self.canvas._boxes = self.annotation.boxes.copy()
+        self.canvas.load_image(img_path, image)
+        # share the list: canvas edits land in the annotation directly
+        self.canvas._boxes = self.annotation.boxes
         self.canvas._selected_box = None
         self.canvas.new_box_class = self.class_spin.value()
-        self.canvas.boxes_changed.emit()
+        # refresh the list directly: emitting boxes_changed here would rebuild
+        # the annotation and flag a freshly loaded image as dirty
+        self._refresh_box_list()
         self.canvas.update()
         self.index_label.setText(f"{self.current_index+1} / {len(self.images)}")
         # update goto control
-        try:
-            self.goto_spin.setRange(1, len(self.images))
-            self.goto_spin.setValue(self.current_index + 1)
-            self.goto_spin.setEnabled(True)
-            self.goto_button.setEnabled(True)
-        except Exception:
-            pass
+        self._sync_goto_controls()
         # update global file with current index
         self._save_global_state()
         # automatically switch to navigate mode when a new image is shown
         self._set_mode(CanvasMode.NAVIGATE)
+        self._schedule_prefetch()
+
+    def _schedule_prefetch(self) -> None:
+        """Start decoding the images around the current one in the background."""
+        radius = self._prefetch_radius
+        neighbours = []
+        for step in range(1, radius + 1):
+            for idx in (self.current_index + step, self.current_index - step):
+                if 0 <= idx < len(self.images):
+                    img = self.images[idx]
+                    neighbours.append((img, self._label_path_for(img)))
+        self._prefetcher.schedule(neighbours)
+
+    def _label_path_for(self, img_path: Path) -> Path:
+        """Return the label file for ``img_path`` (separate folder if set).
+
+        Paths are cached per image; the cache is cleared whenever the label
+        folder text changes.
+        """
+        label_path = self._label_path_cache.get(img_path)
+        if label_path is None:
+            label_dir_text = self._label_dir_edit.text().strip()
+            if label_dir_text:
+                label_path = Path(label_dir_text) / img_path.with_suffix(".txt").name
+            else:
+                label_path = img_path.with_suffix(".txt")
+            self._label_path_cache[img_path] = label_path
+        return label_path
+
+    def _sync_goto_controls(self) -> None:
+        """Match the jump controls to the image list, touching only what changed."""
+        count = len(self.images)
+        if count != self._goto_range_max:
+            self.goto_spin.setRange(1, max(1, count))
+            self._goto_range_max = count
+        enabled = count > 0
+        if self.goto_spin.isEnabled() != enabled:
+            self.goto_spin.setEnabled(enabled)
+            self.goto_button.setEnabled(enabled)
+        if enabled and self.goto_spin.value() != self.current_index + 1:
+            self.goto_spin.blockSignals(True)
+            self.goto_spin.setValue(self.current_index + 1)
+            self.goto_spin.blockSignals(False)
 
     def go_to_image(self) -> None:
         """Jump directly to the image number entered in the spinbox (1-based)."""
@@ -538,35 +672,23 @@ class EditMode(QtWidgets.QWidget):
         if reply != QtWidgets.QMessageBox.StandardButton.Yes:
             return
 
-        # attempt to remove image file
-        try:
-            if img_path.exists():
-                img_path.unlink()
-        except Exception:
-            self._show_temporary_message("Fotoğraf silinemedi")
-
-        # remove corresponding label
-        label_dir_text = self._label_dir_edit.text().strip()
-        if label_dir_text:
-            label_path = Path(label_dir_text) / img_path.with_suffix(".txt").name
-        else:
-            label_path = img_path.with_suffix(".txt")
-        try:
-            if label_path.exists():
-                label_path.unlink()
-        except Exception:
-            pass
+        # remove the image and its label in the background; the UI moves on
+        # right away and _on_delete_finished() puts the image back on failure
+        label_path = self._label_path_for(img_path)
+        QtCore.QThreadPool.globalInstance().start(
+            _DeleteFilesTask(self._delete_signals, img_path, label_path)
+        )
 
         # remove from saved list if present
-        for i in range(self.saved_list.count()):
-            if self.saved_list.item(i).text() == img_path.name:
-                self.saved_list.takeItem(i)
-                break
-        self.saved_count_label.setText(f"Toplam: {self.saved_list.count()}")
+        was_saved = self.saved_model.remove(img_path.name)
+        self.saved_count_label.setText(f"Toplam: {self.saved_model.rowCount()}")
+        self._pending_deletes[img_path] = (self.current_index, was_saved)
 
         # remove from internal state
-        self.annotations.pop(img_path, None)
-        self.dirty.pop(img_path, None)
+        self.image_states.pop(img_path, None)
+        self._size_cache.pop(img_path, None)
+        self._label_path_cache.pop(img_path, None)
+        self._prefetcher.discard(img_path)
         del self.images[self.current_index]
 
         # update navigation
@@ -577,9 +699,7 @@ class EditMode(QtWidgets.QWidget):
             self.canvas._selected_box = None
             self.canvas.update()
             self.index_label.setText("0 / 0")
-            self.goto_spin.setEnabled(False)
-            self.goto_spin.setRange(1, 1)
-            self.goto_button.setEnabled(False)
+            self._sync_goto_controls()
             self._show_temporary_message("Fotoğraf silindi")
             return
 
@@ -588,31 +708,51 @@ class EditMode(QtWidgets.QWidget):
         self._load_current()
         self._show_temporary_message("Fotoğraf silindi")
 
-    def _load_annotation_for(self, img_path: Path) -> None:
-        # determine label path (use separate label folder if provided)
-        label_dir_text = self._label_dir_edit.text().strip()
-        if label_dir_text:
-            label_path = Path(label_dir_text) / img_path.with_suffix(".txt").name
+    def _on_delete_finished(self, img_path: Path, ok: bool) -> None:
+        pending = self._pending_deletes.pop(img_path, None)
+        if ok or pending is None:
+            return
+        # the image is still on disk: put it back where it was
+        index, was_saved = pending
+        index = min(index, len(self.images))
+        self.images.insert(index, img_path)
+        if was_saved:
+            self._add_saved_image(img_path.name)
+        if self.current_index < 0:
+            self.current_index = index
+            self._load_current()
         else:
-            label_path = img_path.with_suffix(".txt")
+            if index <= self.current_index:
+                self.current_index += 1
+            self.index_label.setText(f"{self.current_index+1} / {len(self.images)}")
+            self._sync_goto_controls()
+            self._save_global_state()
+        self._show_temporary_message("Fotoğraf silinemedi")
+
+    def _get_size(self, img_path: Path) -> tuple[int, int]:
+        """Return (width, height) of an image, reading its header only once."""
+        size = self._size_cache.get(img_path)
+        if size is None:
+            size = read_image_size(img_path)
+            if size is None:
+                raise OSError(f"Cannot read image size: {img_path}")
+            self._size_cache[img_path] = size
+        return size
+
+    def _load_annotation_for(self, img_path: Path, rows: Optional[np.ndarray] = None) -> None:
+        """Read the labels of ``img_path`` into ``self.annotation``.
+
+        ``rows`` are label rows parsed ahead of time by the prefetcher; when
+        None the label file is read here.
+        """
+        label_path = self._label_path_for(img_path)
         self.annotation = Annotation()
-        if label_path.exists():
-            from PIL import Image
-
-            with Image.open(img_path) as im:
-                width, height = im.size
-            entries = read_yolo_labels(label_path)
-            for class_id, xc, yc, w, h in entries:
-                # convert normalized to image coordinates
-                x_center = xc * width
-                y_center = yc * height
-                box_w = w * width
-                box_h = h * height
-                x1 = x_center - box_w / 2
-                y1 = y_center - box_h / 2
-                self.annotation.add(BoundingBox(class_id, x1, y1, x1 + box_w, y1 + box_h))
-            self.canvas._boxes = self.annotation.boxes.copy()
-            self.canvas.update()
+        if rows is None and label_path.exists():
+            rows = read_yolo_labels_array(label_path)
+        if rows is not None:
+            width, height = self._get_size(img_path)
+            # convert normalized to image coordinates for all boxes at once
+            self.annotation = Annotation.from_yolo(rows, width, height)
 
     # NOTE: confirmation-on-navigation removed per user request; navigation
     # now simply saves current state in memory and proceeds.
@@ -621,30 +761,20 @@ class EditMode(QtWidgets.QWidget):
         if self.current_index < 0 or self.current_index >= len(self.images):
             return
         img_path = self.images[self.current_index]
-        # Determine output label path (separate folder or same dir)
-        label_dir_text = self._label_dir_edit.text().strip()
-        if label_dir_text:
-            label_path = Path(label_dir_text) / img_path.with_suffix(".txt").name
-        else:
-            label_path = img_path.with_suffix(".txt")
-        entries = []
-        from PIL import Image
-
-        with Image.open(img_path) as im:
-            width, height = im.size
-        for box in self.canvas._boxes:
-            x_center = (box.x1 + box.x2) / 2 / width
-            y_center = (box.y1 + box.y2) / 2 / height
-            w_norm = (box.x2 - box.x1) / width
-            h_norm = (box.y2 - box.y1) / height
-            entries.append((box.class_id, x_center, y_center, w_norm, h_norm))
-        write_yolo_labels(label_path, entries)
+        label_path = self._label_path_for(img_path)
+        width, height = self._get_size(img_path)
+        # the canvas edits the annotation's own list, so this is what is shown
+        write_yolo_labels_array(label_path, self.annotation.to_yolo(width, height))
+        # labels parsed ahead of time no longer match the file
+        self._prefetcher.discard_labels(img_path)
         # show a small non-intrusive notification instead of a dialog
         self._show_temporary_message("Kaydedildi")
         # add to saved-list UI
         self._add_saved_image(img_path.name)
         # mark this image clean
-        self.dirty[self.images[self.current_index]] = False
+        state = self.image_states.get(img_path)
+        if state is not None:
+            state.dirty = False
         if advance:
             # move to next image after saving (mimic previous "next" behavior)
             if self.current_index + 1 < len(self.images):
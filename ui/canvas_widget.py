@@ -2,15 +2,92 @@
 
 from __future__ import annotations
 
+import math
 from enum import Enum
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+import numpy as np
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from core.bbox_model import BoundingBox
 
 
+def prepare_for_display(image: QtGui.QImage) -> QtGui.QImage:
+    """Convert ``image`` to a format the raster engine can blit without per-pixel work.
+
+    Images with alpha are premultiplied once here instead of on every draw;
+    opaque images (e.g. decoded JPEGs) are already in the fast RGB32 format.
+    Safe to call off the GUI thread.
+    """
+    if image.hasAlphaChannel():
+        if image.format() != QtGui.QImage.Format.Format_ARGB32_Premultiplied:
+            return image.convertToFormat(QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    elif image.format() != QtGui.QImage.Format.Format_RGB32:
+        return image.convertToFormat(QtGui.QImage.Format.Format_RGB32)
+    return image
+
+
+def _coords_array(boxes: List[BoundingBox]) -> np.ndarray:
+    """Return the normalized (N, 4) ``x1, y1, x2, y2`` array of ``boxes``."""
+    coords = np.array([(b.x1, b.y1, b.x2, b.y2) for b in boxes], dtype=np.float64).reshape(-1, 4)
+    # boxes resized past their opposite edge have x1 > x2 (or y1 > y2)
+    return np.concatenate(
+        (np.minimum(coords[:, :2], coords[:, 2:]), np.maximum(coords[:, :2], coords[:, 2:])),
+        axis=1,
+    )
+
+
+def _box_overlaps(box: BoundingBox, left: float, top: float, right: float, bottom: float) -> bool:
+    """Return whether ``box`` (in either corner order) touches the given rectangle."""
+    return (
+        min(box.x1, box.x2) <= right
+        and max(box.x1, box.x2) >= left
+        and min(box.y1, box.y2) <= bottom
+        and max(box.y1, box.y2) >= top
+    )
+
+
+class _ScaleSignals(QtCore.QObject):
+    # request serial, scaled image
+    finished = QtCore.pyqtSignal(int, object)
+
+
+class _SmoothScaleTask(QtCore.QRunnable):
+    """Crops and smoothly resizes an image region on a pool thread."""
+
+    def __init__(
+        self,
+        signals: _ScaleSignals,
+        serial: int,
+        image: QtGui.QImage,
+        source: QtCore.QRect,
+        width: int,
+        height: int,
+    ):
+        super().__init__()
+        self._signals = signals
+        self._serial = serial
+        self._image = image
+        self._source = source
+        self._width = width
+        self._height = height
+
+    def run(self) -> None:
+        region = self._image if self._source == self._image.rect() else self._image.copy(self._source)
+        scaled = region.scaled(
+            self._width,
+            self._height,
+            QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
+            QtCore.Qt.TransformationMode.SmoothTransformation,
+        )
+        try:
+            self._signals.finished.emit(self._serial, prepare_for_display(scaled))
+        except RuntimeError:
+            # the canvas was destroyed meanwhile
+            pass
+
+
 class CanvasMode(Enum):
     """Canvas interaction modes."""
     NAVIGATE = "navigate"  # pan/zoom only
@@ -19,13 +96,68 @@ class CanvasMode(Enum):
 
 
 class CanvasWidget(QtWidgets.QWidget):
+    # a pre-scaled copy of the visible part of the image is only kept while
+    # it stays within this many times the widget's device pixel area (the
+    # source may be any size: it is resized on a pool thread); otherwise the
+    # image is scaled as drawn
+    SCALED_AREA_FACTOR = 4
+    # screen pixels a class id label can reach past its box corner
+    LABEL_MARGIN = 48
+    # boxes appended since the hit-test index was built that are scanned
+    # linearly before they are folded into it
+    INDEX_TAIL_LIMIT = 32
+
     boxes_changed = QtCore.pyqtSignal()
+    # a click picked a different box (or none); no geometry changed
+    selection_changed = QtCore.pyqtSignal()
     mode_changed = QtCore.pyqtSignal(object)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._pixmap: Optional[QtGui.QPixmap] = None
+        # _scaled_source of _pixmap smoothly resized for _scaled_key (scale,
+        # dpr), so repaints are a plain blit
+        self._scaled_copy: Optional[QtGui.QImage] = None
+        self._scaled_source = QtCore.QRect()
+        self._scaled_key: Optional[tuple] = None
+        # the copy is made on a pool thread; only the result of the latest
+        # request (_scale_serial) is kept
+        self._scale_signals = _ScaleSignals(self)
+        self._scale_signals.finished.connect(self._on_scale_finished)
+        self._scale_serial = 0
+        self._scale_pending: Optional[tuple] = None
+        # while zooming/panning the image is drawn with the fast filter and
+        # no copy is made; once input has been idle for a moment the smooth
+        # copy is requested
+        self._interacting = False
+        self._idle_timer = QtCore.QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(150)
+        self._idle_timer.timeout.connect(self._on_interaction_idle)
+        # unselected boxes pre-rendered at widget size; see _static_boxes_layer
+        self._static_layer: Optional[QtGui.QPixmap] = None
+        self._static_layer_key: Optional[tuple] = None
+        # (N, 4) normalized x1, y1, x2, y2 of _boxes for vectorized hit tests
+        self._box_coords: Optional[np.ndarray] = None
+        self._box_coords_key: Optional[int] = None
+        # id(box) -> position in _boxes, rebuilt lazily when found stale
+        self._box_ids: dict[int, int] = {}
+
+        # paint objects built once; widths and font size track the zoom
+        # through _sync_paint_objects()
+        self._box_pen = QtGui.QPen(QtGui.QColor("red"))
+        self._selected_pen = QtGui.QPen(QtGui.QColor("magenta"))
+        self._rubber_band_pen = QtGui.QPen(QtGui.QColor("blue"), 1, QtCore.Qt.PenStyle.DashLine)
+        self._handle_brush = QtGui.QBrush(QtGui.QColor("magenta"))
+        self._label_text_pen = QtGui.QPen(QtGui.QColor("white"))
+        self._box_label_brush = self._label_brush(self._box_pen.color())
+        self._selected_label_brush = self._label_brush(self._selected_pen.color())
+        self._label_font = QtGui.QFont(self.font())
+        self._label_metrics = QtGui.QFontMetricsF(self._label_font)
+        self._paint_scale = 0.0
         self._scale = 1.0
+        # derived from _scale by _set_scale(); multiply instead of divide
+        self._inv_scale = 1.0
         self._offset = QtCore.QPointF(0, 0)
         self._boxes: List[BoundingBox] = []
         self._selected_box: Optional[BoundingBox] = None
@@ -45,10 +177,122 @@ class CanvasWidget(QtWidgets.QWidget):
         self._resizing = False
         self._resize_handle = None  # which corner/edge: 'tl', 'tr', 'bl', 'br', 'l', 'r', 't', 'b'
         self._handle_size = 8
-
+        self._handle_size_img = self._handle_size * self._inv_scale
+
+        # mouse moves can arrive far faster than the screen refreshes; their
+        # repaints are folded into at most one per frame
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._on_update_tick)
+        # latest widget-space cursor position of a drag/resize not yet applied
+        self._pending_drag_pos: Optional[QtCore.QPointF] = None
+        # what the next tick repaints: everything, or the union of regions
+        self._dirty_full = False
+        self._dirty_rect: Optional[QtCore.QRectF] = None
+
+        # paintEvent covers every pixel itself, so Qt needn't erase first
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_OpaquePaintEvent)
         self.setMouseTracking(True)
         self.setFocusPolicy(QtCore.Qt.FocusPolicy.StrongFocus)
 
+    def _set_scale(self, scale: float) -> None:
+        """Set the zoom factor along with the values derived from it."""
+        self._scale = scale
+        self._inv_scale = 1.0 / scale
+        self._handle_size_img = self._handle_size * self._inv_scale
+
+    def _begin_interaction(self) -> None:
+        """Use fast image scaling until input has been idle for a moment."""
+        self._interacting = True
+        # a copy still being made is for a view the user is leaving
+        self._scale_pending = None
+        self._idle_timer.start()
+
+    def _on_interaction_idle(self) -> None:
+        self._interacting = False
+        self.update()
+
+    def _request_update(self, rect: Optional[QtCore.QRectF] = None) -> None:
+        """Schedule a repaint for the next frame unless one is already pending.
+
+        With ``rect`` (widget coordinates) only that region is repainted,
+        merged with any other regions requested before the frame.
+        """
+        if rect is None:
+            self._dirty_full = True
+        else:
+            self._mark_dirty(rect)
+        self._schedule_tick()
+
+    def _schedule_tick(self) -> None:
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _on_update_tick(self) -> None:
+        self._apply_pending_drag()
+        self._flush_update()
+
+    def _flush_update(self) -> None:
+        """Repaint what was collected since the last tick: the widget, or just a region."""
+        if self._dirty_full:
+            self.update()
+        elif self._dirty_rect is not None:
+            self.update(self._dirty_rect.toAlignedRect())
+        self._dirty_full = False
+        self._dirty_rect = None
+
+    def _mark_dirty(self, rect: QtCore.QRectF) -> None:
+        if not self._dirty_full:
+            self._dirty_rect = rect if self._dirty_rect is None else self._dirty_rect.united(rect)
+
+    def _widget_rect(self, x1: float, y1: float, x2: float, y2: float, margin: float) -> QtCore.QRectF:
+        """Map an image-space rectangle to widget space, grown by ``margin`` screen pixels."""
+        scale = self._scale
+        ox, oy = self._offset.x(), self._offset.y()
+        left, right = sorted((x1 * scale + ox, x2 * scale + ox))
+        top, bottom = sorted((y1 * scale + oy, y2 * scale + oy))
+        return QtCore.QRectF(left - margin, top - margin, right - left + 2 * margin, bottom - top + 2 * margin)
+
+    def _selected_widget_rect(self, box: BoundingBox) -> QtCore.QRectF:
+        # covers the outline, resize handles and the class id label
+        return self._widget_rect(box.x1, box.y1, box.x2, box.y2, self.LABEL_MARGIN)
+
+    def _update_box_regions(self, *boxes: Optional[BoundingBox]) -> None:
+        """Repaint only the areas of ``boxes``: outline, handles and class id label."""
+        for box in boxes:
+            if box is not None:
+                self.update(self._selected_widget_rect(box).toAlignedRect())
+
+    def _apply_pending_drag(self) -> None:
+        """Move or resize the selected box to the last recorded cursor position."""
+        widget_pos = self._pending_drag_pos
+        if widget_pos is None:
+            return
+        self._pending_drag_pos = None
+        box = self._selected_box
+        if box is None:
+            return
+        x, y = self._to_image_xy(widget_pos.x(), widget_pos.y())
+        # only the area the box leaves and the area it enters need repainting
+        self._mark_dirty(self._selected_widget_rect(box))
+        if self._resizing and self._resize_handle:
+            self._resize_box(box, self._resize_handle, x, y)
+        elif self._dragging:
+            start = self._drag_start
+            dx = x - start.x()
+            dy = y - start.y()
+            box.x1 += dx
+            box.y1 += dy
+            box.x2 += dx
+            box.y2 += dy
+            start.setX(x)
+            start.setY(y)
+        else:
+            return
+        self._mark_dirty(self._selected_widget_rect(box))
+        self.boxes_changed.emit()
+
     def set_mode(self, mode: CanvasMode) -> None:
         """Switch interaction mode."""
         if self._mode == mode:
@@ -60,8 +304,17 @@ class CanvasWidget(QtWidgets.QWidget):
             self.setCursor(QtCore.Qt.CursorShape.ArrowCursor)
         self.mode_changed.emit(mode)
 
-    def load_image(self, path: Path) -> None:
-        self._pixmap = QtGui.QPixmap(str(path))
+    def load_image(self, path: Path, image: Optional[QtGui.QImage] = None) -> None:
+        """Show ``path``, or the already decoded ``image`` of it if given."""
+        if image is None:
+            image = QtGui.QImage(str(path))
+        self._pixmap = QtGui.QPixmap.fromImage(prepare_for_display(image))
+        self._scaled_copy = None
+        self._scale_serial += 1
+        self._scale_pending = None
+        self.invalidate_boxes()
+        # quick first frame; the smooth one follows if the user stays here
+        self._begin_interaction()
         self.fit_image_to_view()
         QtCore.QTimer.singleShot(0, self.fit_image_to_view)
         self.update()
@@ -69,7 +322,7 @@ class CanvasWidget(QtWidgets.QWidget):
     def fit_image_to_view(self) -> None:
         """Fit the loaded image inside the current canvas and center it."""
         if not self._pixmap or self._pixmap.isNull():
-            self._scale = 1.0
+            self._set_scale(1.0)
             self._offset = QtCore.QPointF(0, 0)
             return
 
@@ -84,7 +337,7 @@ class CanvasWidget(QtWidgets.QWidget):
         scale_x = available_width / image_width
         scale_y = available_height / image_height
 
-        self._scale = min(scale_x, scale_y)
+        self._set_scale(min(scale_x, scale_y))
         scaled_width = image_width * self._scale
         scaled_height = image_height * self._scale
         self._offset = QtCore.QPointF(
@@ -94,49 +347,305 @@ class CanvasWidget(QtWidgets.QWidget):
         self.update()
 
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+        self._sync_paint_objects()
         painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.fillRect(event.rect(), self.palette().color(QtGui.QPalette.ColorRole.Window))
+        if self._pixmap is None and not self._boxes and self._current_rect is None:
+            # nothing loaded: the background fill is all there is to draw
+            return
         if self._pixmap:
-            # draw image with current transform
-            painter.save()
-            painter.translate(self._offset)
-            painter.scale(self._scale, self._scale)
-            painter.drawPixmap(0, 0, self._pixmap)
-            painter.restore()
-
-        # draw bboxes WITH transform applied so they scale with image
+            scaled = self._scaled_image()
+            if scaled is not None:
+                source, image = scaled
+                painter.drawImage(self._source_widget_rect(source).topLeft(), image)
+            else:
+                # scale just the visible part of the image while drawing it
+                source = self._visible_source_rect()
+                target = self._source_widget_rect(source)
+                painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform, not self._interacting)
+                painter.drawPixmap(target, self._pixmap, QtCore.QRectF(source))
+                painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform, False)
+
+        # every box except the selected one comes from a cached layer, so
+        # dragging or resizing the selection doesn't repaint the rest
+        if self._boxes:
+            painter.drawPixmap(0, 0, self._static_boxes_layer())
+
+        if self._selected_box is None and self._current_rect is None:
+            return
+        # only the selection and rubber band are worth antialiasing
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+
+        # draw the live parts WITH transform applied so they scale with image
         painter.save()
         painter.translate(self._offset)
         painter.scale(self._scale, self._scale)
-        
-        for box in self._boxes:
-            rect = QtCore.QRectF(box.x1, box.y1, box.width(), box.height())
-            # a couple pixels thicker makes boxes easier to see
-            if box is self._selected_box:
-                pen = QtGui.QPen(QtGui.QColor("magenta"), 3 / self._scale)
-            else:
-                pen = QtGui.QPen(QtGui.QColor("red"), 2 / self._scale)
-            painter.setPen(pen)
-            painter.drawRect(rect)
-            self._draw_box_class_id(painter, box, pen.color())
-            
+
+        box = self._selected_box
+        if box is not None and self._box_visible(box, self._visible_image_rect()):
+            self._draw_box(painter, box, True)
             # draw resize handles if selected
-            if box is self._selected_box and self._mode == CanvasMode.SELECT:
-                handle_size_transformed = self._handle_size / self._scale
-                handle_brush = QtGui.QBrush(QtGui.QColor("magenta"))
-                # corners
-                painter.fillRect(QtCore.QRectF(box.x1 - handle_size_transformed/2, box.y1 - handle_size_transformed/2, handle_size_transformed, handle_size_transformed), handle_brush)
-                painter.fillRect(QtCore.QRectF(box.x2 - handle_size_transformed/2, box.y1 - handle_size_transformed/2, handle_size_transformed, handle_size_transformed), handle_brush)
-                painter.fillRect(QtCore.QRectF(box.x1 - handle_size_transformed/2, box.y2 - handle_size_transformed/2, handle_size_transformed, handle_size_transformed), handle_brush)
-                painter.fillRect(QtCore.QRectF(box.x2 - handle_size_transformed/2, box.y2 - handle_size_transformed/2, handle_size_transformed, handle_size_transformed), handle_brush)
+            if self._mode == CanvasMode.SELECT:
+                handle_size_transformed = self._handle_size_img
+                half = handle_size_transformed / 2
+                # corners, filled in one call
+                painter.setPen(QtCore.Qt.PenStyle.NoPen)
+                painter.setBrush(self._handle_brush)
+                painter.drawRects([
+                    QtCore.QRectF(x - half, y - half, handle_size_transformed, handle_size_transformed)
+                    for x, y in ((box.x1, box.y1), (box.x2, box.y1), (box.x1, box.y2), (box.x2, box.y2))
+                ])
+                painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
 
         # draw rectangle being created (in MARK mode)
         if self._current_rect and self._mode == CanvasMode.MARK:
-            painter.setPen(QtGui.QPen(QtGui.QColor("blue"), 1 / self._scale, QtCore.Qt.PenStyle.DashLine))
+            painter.setPen(self._rubber_band_pen)
             painter.drawRect(self._current_rect.normalized())
         
         painter.restore()
 
+    def _draw_box(self, painter: QtGui.QPainter, box: BoundingBox, selected: bool) -> None:
+        """Draw one box outline and its class id; ``painter`` is in image coordinates."""
+        rect = QtCore.QRectF(box.x1, box.y1, box.width(), box.height())
+        painter.setPen(self._selected_pen if selected else self._box_pen)
+        painter.drawRect(rect)
+        self._draw_box_class_id(
+            painter, box, self._selected_label_brush if selected else self._box_label_brush
+        )
+
+    @staticmethod
+    def _label_brush(color: QtGui.QColor) -> QtGui.QBrush:
+        background = QtGui.QColor(color)
+        background.setAlpha(210)
+        return QtGui.QBrush(background)
+
+    def _sync_paint_objects(self) -> None:
+        """Rescale the cached pens and label font after a zoom change."""
+        if self._paint_scale == self._scale:
+            return
+        self._paint_scale = self._scale
+        # a couple pixels thicker makes boxes easier to see
+        inv_scale = self._inv_scale
+        self._box_pen.setWidthF(2 * inv_scale)
+        self._selected_pen.setWidthF(3 * inv_scale)
+        self._rubber_band_pen.setWidthF(inv_scale)
+        self._label_font.setPixelSize(max(1, int(round(11 * inv_scale))))
+        self._label_metrics = QtGui.QFontMetricsF(self._label_font)
+
+    def _visible_image_rect(self) -> Tuple[float, float, float, float]:
+        """Return the visible area in image coordinates as (left, top, right, bottom).
+
+        The area is grown by LABEL_MARGIN so boxes just outside the view whose
+        class id label still reaches into it are kept.
+        """
+        margin = self.LABEL_MARGIN * self._inv_scale
+        top_left = self._to_image_coords(QtCore.QPointF(0, 0))
+        bottom_right = self._to_image_coords(QtCore.QPointF(self.width(), self.height()))
+        return (
+            top_left.x() - margin,
+            top_left.y() - margin,
+            bottom_right.x() + margin,
+            bottom_right.y() + margin,
+        )
+
+    @staticmethod
+    def _box_visible(box: BoundingBox, view: Tuple[float, float, float, float]) -> bool:
+        left, top, right, bottom = view
+        return not (
+            max(box.x1, box.x2) < left
+            or min(box.x1, box.x2) > right
+            or max(box.y1, box.y2) < top
+            or min(box.y1, box.y2) > bottom
+        )
+
+    def _visible_box_indices(self, view: Tuple[float, float, float, float]) -> np.ndarray:
+        """Return the indices of boxes overlapping ``view``, using one mask over the coordinate array."""
+        left, top, right, bottom = view
+        coords = self._coords_index()
+        visible = np.flatnonzero(
+            (coords[:, 2] >= left) & (coords[:, 0] <= right) & (coords[:, 3] >= top) & (coords[:, 1] <= bottom)
+        )
+        tail = [
+            i
+            for i in range(len(coords), len(self._boxes))
+            if _box_overlaps(self._boxes[i], left, top, right, bottom)
+        ]
+        if tail:
+            visible = np.concatenate((visible, np.array(tail, dtype=visible.dtype)))
+        return visible
+
+    def invalidate_boxes(self) -> None:
+        """Force the cached box layer and hit-test index to be rebuilt."""
+        self._static_layer_key = None
+        self._box_coords = None
+
+    def _coords_index(self) -> np.ndarray:
+        """Return the (N, 4) coordinate array of _boxes, building it when stale.
+
+        The array may cover only a prefix of _boxes: boxes appended since the
+        last build (one per MARK release) are left to a linear scan of the
+        tail until there are more than INDEX_TAIL_LIMIT of them, then only
+        those rows are converted and appended in one go.
+        """
+        boxes = self._boxes
+        coords = self._box_coords
+        if coords is None or self._box_coords_key != id(boxes) or len(coords) > len(boxes):
+            self._box_coords = _coords_array(boxes)
+            self._box_coords_key = id(boxes)
+        elif len(boxes) - len(coords) > self.INDEX_TAIL_LIMIT:
+            self._box_coords = np.concatenate((coords, _coords_array(boxes[len(coords):])))
+        return self._box_coords
+
+    def _refresh_coords_row(self, box: BoundingBox) -> None:
+        """Rewrite the index row of ``box`` after it was moved or resized."""
+        coords = self._box_coords
+        if coords is None:
+            return
+        index = self._index_of(box)
+        if 0 <= index < len(coords):
+            coords[index] = _coords_array([box])[0]
+
+    def _index_of(self, box: BoundingBox) -> int:
+        """Return the position of ``box`` (by identity) in _boxes, or -1."""
+        index = self._box_ids.get(id(box), -1)
+        if 0 <= index < len(self._boxes) and self._boxes[index] is box:
+            return index
+        self._box_ids = {id(b): i for i, b in enumerate(self._boxes)}
+        return self._box_ids.get(id(box), -1)
+
+    def _box_at(self, x: float, y: float) -> Optional[BoundingBox]:
+        """Return the first box (in list order) containing image point (x, y), or None."""
+        coords = self._coords_index()
+        hits = np.flatnonzero(
+            (coords[:, 0] <= x) & (x <= coords[:, 2]) & (coords[:, 1] <= y) & (y <= coords[:, 3])
+        )
+        if hits.size:
+            return self._boxes[hits[0]]
+        for box in self._boxes[len(coords):]:
+            if _box_overlaps(box, x, y, x, y):
+                return box
+        return None
+
+    def _static_boxes_layer(self) -> QtGui.QPixmap:
+        """Return a widget-sized transparent pixmap with all unselected boxes drawn.
+
+        It is rebuilt only when the view (zoom, pan, size), the box list or
+        the selection changes, or after invalidate_boxes().
+        """
+        dpr = self.devicePixelRatioF()
+        key = (
+            self._scale,
+            self._offset.x(),
+            self._offset.y(),
+            self.width(),
+            self.height(),
+            dpr,
+            id(self._boxes),
+            len(self._boxes),
+            id(self._selected_box),
+        )
+        if self._static_layer is not None and key == self._static_layer_key:
+            return self._static_layer
+        layer = QtGui.QPixmap(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+        layer.setDevicePixelRatio(dpr)
+        layer.fill(QtCore.Qt.GlobalColor.transparent)
+        self._sync_paint_objects()
+        painter = QtGui.QPainter(layer)
+        painter.translate(self._offset)
+        painter.scale(self._scale, self._scale)
+        selected = self._selected_box
+        view = self._visible_image_rect()
+        boxes = self._boxes
+        visible = [boxes[i] for i in self._visible_box_indices(view).tolist() if boxes[i] is not selected]
+        # all outlines share one pen, so they go out in a single call
+        painter.setPen(self._box_pen)
+        painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+        painter.drawRects([QtCore.QRectF(b.x1, b.y1, b.width(), b.height()) for b in visible])
+        for box in visible:
+            self._draw_box_class_id(painter, box, self._box_label_brush)
+        painter.end()
+        self._static_layer = layer
+        self._static_layer_key = key
+        return layer
+
+    def _visible_source_rect(self) -> QtCore.QRect:
+        """Return the image pixels covered by the widget, clipped to the image."""
+        left, top = self._to_image_xy(0, 0)
+        right, bottom = self._to_image_xy(self.width(), self.height())
+        rect = QtCore.QRect(
+            QtCore.QPoint(math.floor(left), math.floor(top)),
+            QtCore.QPoint(math.ceil(right) - 1, math.ceil(bottom) - 1),
+        )
+        return rect.intersected(self._pixmap.rect())
+
+    def _source_widget_rect(self, source: QtCore.QRect) -> QtCore.QRectF:
+        """Map a rectangle of image pixels to widget space."""
+        return self._widget_rect(
+            source.x(), source.y(), source.x() + source.width(), source.y() + source.height(), 0
+        )
+
+    def _scaled_image(self) -> Optional[Tuple[QtCore.QRect, QtGui.QImage]]:
+        """Return ``(source, image)``: the visible image region resized to the current zoom.
+
+        Returns None, and the image is drawn scaled instead, while the copy
+        is missing or stale. A new copy is requested once input is idle and
+        it fits in ``SCALED_AREA_FACTOR`` times the widget area.
+        """
+        if self._pixmap is None or self._pixmap.isNull():
+            return None
+        visible = self._visible_source_rect()
+        if visible.isEmpty():
+            return None
+        key = (self._scale, self.devicePixelRatioF())
+        if (
+            self._scaled_copy is not None
+            and self._scaled_key == key
+            and self._scaled_source.contains(visible)
+        ):
+            return self._scaled_source, self._scaled_copy
+        if not self._interacting:
+            self._request_scaled_image(visible, key)
+        return None
+
+    def _request_scaled_image(self, visible: QtCore.QRect, key: tuple) -> None:
+        """Start resizing the padded ``visible`` region in the background, if it pays off."""
+        pending = self._scale_pending
+        if pending is not None and pending[2] == key and pending[1].contains(visible):
+            return
+        # padded so short pans reuse the copy
+        pad_x = visible.width() // 4
+        pad_y = visible.height() // 4
+        source = visible.adjusted(-pad_x, -pad_y, pad_x, pad_y).intersected(self._pixmap.rect())
+        scale, dpr = key
+        width = max(1, round(source.width() * scale * dpr))
+        height = max(1, round(source.height() * scale * dpr))
+        budget = self.SCALED_AREA_FACTOR * self.width() * self.height() * dpr * dpr
+        if width * height > budget:
+            return
+        self._scale_serial += 1
+        self._scale_pending = (self._scale_serial, source, key)
+        # a raster pixmap shares its pixels with toImage(), so the crop is
+        # left to the pool thread too
+        QtCore.QThreadPool.globalInstance().start(
+            _SmoothScaleTask(
+                self._scale_signals, self._scale_serial, self._pixmap.toImage(), source, width, height
+            )
+        )
+
+    def _on_scale_finished(self, serial: int, image: QtGui.QImage) -> None:
+        pending = self._scale_pending
+        if pending is None or pending[0] != serial:
+            return
+        self._scale_pending = None
+        _, source, key = pending
+        # kept as a QImage: the raster engine blits it just as fast, and
+        # converting to a pixmap would copy it again on this thread
+        image.setDevicePixelRatio(key[1])
+        self._scaled_copy = image
+        self._scaled_source = source
+        self._scaled_key = key
+        self.update()
+
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
         if self._mode == CanvasMode.NAVIGATE:
             # allow both middle-button and left-button drag to pan the image
@@ -153,26 +662,26 @@ class CanvasWidget(QtWidgets.QWidget):
         
         elif self._mode == CanvasMode.SELECT:
             if event.button() == QtCore.Qt.MouseButton.LeftButton:
-                pos = self._to_image_coords(event.position())
+                widget_pos = event.position()
+                x, y = self._to_image_xy(widget_pos.x(), widget_pos.y())
                 # check if clicking on a handle
                 if self._selected_box:
-                    handle = self._get_handle_at(pos, self._selected_box)
+                    handle = self._get_handle_at(x, y, self._selected_box)
                     if handle:
                         self._resizing = True
                         self._resize_handle = handle
                         return
                 
                 # otherwise try to select a box
-                self._selected_box = None
-                for box in self._boxes:
-                    rect = QtCore.QRectF(box.x1, box.y1, box.width(), box.height())
-                    if rect.contains(pos):
-                        self._selected_box = box
-                        self._dragging = True
-                        self._drag_start = pos
-                        break
-                self.boxes_changed.emit()
-                self.update()
+                previous = self._selected_box
+                self._selected_box = self._box_at(x, y)
+                if self._selected_box is not None:
+                    self._dragging = True
+                    self._drag_start = QtCore.QPointF(x, y)
+                if self._selected_box is not previous:
+                    self.selection_changed.emit()
+                    # only the old and new selection change appearance
+                    self._update_box_regions(previous, self._selected_box)
             
             elif event.button() == QtCore.Qt.MouseButton.MiddleButton:
                 self._panning = True
@@ -184,38 +693,41 @@ class CanvasWidget(QtWidgets.QWidget):
                 delta = event.pos() - self._pan_start
                 self._offset += QtCore.QPointF(delta)
                 self._pan_start = event.pos()
-                self.update()
+                self._begin_interaction()
+                self._request_update()
         
         elif self._mode == CanvasMode.MARK:
             self._set_crosshair_cursor()
             if self._dragging and self._current_rect is not None:
                 pos = self._to_image_coords(event.position())
+                old = self._current_rect
                 self._current_rect = QtCore.QRectF(self._drag_start, pos).normalized()
-                self.update()
+                # repaint the old and new rubber band only
+                new = self._current_rect
+                margin = self._handle_size
+                self._request_update(
+                    self._widget_rect(old.left(), old.top(), old.right(), old.bottom(), margin).united(
+                        self._widget_rect(new.left(), new.top(), new.right(), new.bottom(), margin)
+                    )
+                )
         
         elif self._mode == CanvasMode.SELECT:
-            if self._resizing and self._selected_box and self._resize_handle:
-                pos = self._to_image_coords(event.position())
-                self._resize_box(self._selected_box, self._resize_handle, pos)
-                self.boxes_changed.emit()
-                self.update()
-            elif self._dragging and self._selected_box:
-                delta = self._to_image_coords(event.position()) - self._drag_start
-                self._selected_box.x1 += delta.x()
-                self._selected_box.y1 += delta.y()
-                self._selected_box.x2 += delta.x()
-                self._selected_box.y2 += delta.y()
-                self._drag_start = self._to_image_coords(event.position())
-                self.boxes_changed.emit()
-                self.update()
+            if (self._resizing and self._resize_handle or self._dragging) and self._selected_box:
+                # only remember where the cursor is; the box is moved once
+                # per frame in _apply_pending_drag(), which also decides
+                # which region to repaint
+                self._pending_drag_pos = event.position()
+                self._schedule_tick()
             elif self._panning:
                 delta = event.pos() - self._pan_start
                 self._offset += QtCore.QPointF(delta)
                 self._pan_start = event.pos()
-                self.update()
+                self._begin_interaction()
+                self._request_update()
             else:
-                pos = self._to_image_coords(event.position())
-                if self._selected_box and self._get_handle_at(pos, self._selected_box):
+                widget_pos = event.position()
+                x, y = self._to_image_xy(widget_pos.x(), widget_pos.y())
+                if self._selected_box and self._get_handle_at(x, y, self._selected_box):
                     self.setCursor(QtCore.Qt.CursorShape.SizeAllCursor)
                 else:
                     self.setCursor(QtCore.Qt.CursorShape.ArrowCursor)
@@ -226,6 +738,12 @@ class CanvasWidget(QtWidgets.QWidget):
                 self._dragging = False
                 if self._current_rect is not None:
                     rect = self._current_rect.normalized()
+                    # the rubber band goes away, the new box takes its place
+                    self.update(
+                        self._widget_rect(
+                            rect.left(), rect.top(), rect.right(), rect.bottom(), self._handle_size
+                        ).toAlignedRect()
+                    )
                     new_box = BoundingBox(
                         self.new_box_class,
                         rect.left(),
@@ -236,14 +754,20 @@ class CanvasWidget(QtWidgets.QWidget):
                     self._boxes.append(new_box)
                     # select the newly created box
                     self._selected_box = new_box
+                    self._update_box_regions(new_box)
                     # emit signal to indicate boxes changed and switch to select mode
                     self.boxes_changed.emit()
                     # after drawing a box, switch to select mode so user can edit it
                     self.set_mode(CanvasMode.SELECT)
                 # always clear the current rect when releasing in MARK mode
                 self._current_rect = None
-                self.update()
             elif self._mode == CanvasMode.SELECT:
+                # land the last move before the drag ends
+                self._apply_pending_drag()
+                self._flush_update()
+                if (self._dragging or self._resizing) and self._selected_box is not None:
+                    # the selected box moved: refresh its hit-test index row
+                    self._refresh_coords_row(self._selected_box)
                 self._dragging = False
                 self._resizing = False
                 self._resize_handle = None
@@ -260,8 +784,8 @@ class CanvasWidget(QtWidgets.QWidget):
             delta = event.angleDelta().y()
             factor = 1.0 + (delta / 1200)
             old_pos = self._to_image_coords(event.position())
-            self._scale *= factor
-            self._scale = max(0.1, min(self._scale, 10.0))  # clamp
+            self._begin_interaction()
+            self._set_scale(max(0.1, min(self._scale * factor, 10.0)))  # clamp
             new_pos = self._to_image_coords(event.position())
             self._offset += (new_pos - old_pos) * self._scale
             self.update()
@@ -275,30 +799,36 @@ class CanvasWidget(QtWidgets.QWidget):
         """Delete current selection and return whether a box was removed."""
         if not self._selected_box:
             return False
-        if self._selected_box in self._boxes:
-            self._boxes.remove(self._selected_box)
+        self._update_box_regions(self._selected_box)
+        # by identity: list.remove() would compare dataclass fields and could
+        # drop a different box with the same coordinates
+        index = self._index_of(self._selected_box)
+        if index >= 0:
+            del self._boxes[index]
+            if self._box_coords is not None and index < len(self._box_coords):
+                self._box_coords = np.delete(self._box_coords, index, axis=0)
+            elif self._box_coords is not None and len(self._box_coords) > len(self._boxes):
+                self._box_coords = None
         self._selected_box = None
         self.boxes_changed.emit()
-        self.update()
         return True
 
     def _draw_box_class_id(
         self,
         painter: QtGui.QPainter,
         box: BoundingBox,
-        color: QtGui.QColor,
+        background: QtGui.QBrush,
     ) -> None:
         """Draw the class id just outside the bottom-right corner of a box."""
         painter.save()
         text = str(box.class_id)
-        font = painter.font()
-        font.setPixelSize(max(1, int(round(11 / self._scale))))
-        painter.setFont(font)
-
-        metrics = QtGui.QFontMetricsF(font)
-        padding_x = 4 / self._scale
-        padding_y = 2 / self._scale
-        gap = 3 / self._scale
+        painter.setFont(self._label_font)
+
+        metrics = self._label_metrics
+        inv_scale = self._inv_scale
+        padding_x = 4 * inv_scale
+        padding_y = 2 * inv_scale
+        gap = 3 * inv_scale
         text_width = metrics.horizontalAdvance(text)
         text_height = metrics.height()
         label_rect = QtCore.QRectF(
@@ -308,70 +838,88 @@ class CanvasWidget(QtWidgets.QWidget):
             text_height + padding_y * 2,
         )
 
-        background = QtGui.QColor(color)
-        background.setAlpha(210)
         painter.setPen(QtCore.Qt.PenStyle.NoPen)
-        painter.setBrush(QtGui.QBrush(background))
+        painter.setBrush(background)
         painter.drawRect(label_rect)
-        painter.setPen(QtGui.QPen(QtGui.QColor("white")))
+        painter.setPen(self._label_text_pen)
         painter.drawText(label_rect, QtCore.Qt.AlignmentFlag.AlignCenter, text)
         painter.restore()
 
-    def _get_handle_at(self, pos: QtCore.QPointF, box: BoundingBox) -> Optional[str]:
-        """Check if pos is near a resize handle. Returns handle name or None."""
-        threshold = self._handle_size / self._scale
-        x, y = pos.x(), pos.y()
-        
+    def _get_handle_at(self, x: float, y: float, box: BoundingBox) -> Optional[str]:
+        """Check if image point (x, y) is near a resize handle. Returns handle name or None."""
+        threshold = self._handle_size_img
+        x1, y1, x2, y2 = box.x1, box.y1, box.x2, box.y2
+
+        # most hover events are nowhere near the selected box
+        if (
+            x < min(x1, x2) - threshold
+            or x > max(x1, x2) + threshold
+            or y < min(y1, y2) - threshold
+            or y > max(y1, y2) + threshold
+        ):
+            return None
+
+        near_l = abs(x - x1) < threshold
+        near_r = abs(x - x2) < threshold
+        near_t = abs(y - y1) < threshold
+        near_b = abs(y - y2) < threshold
+
         # corners
-        if abs(x - box.x1) < threshold and abs(y - box.y1) < threshold:
-            return "tl"
-        if abs(x - box.x2) < threshold and abs(y - box.y1) < threshold:
-            return "tr"
-        if abs(x - box.x1) < threshold and abs(y - box.y2) < threshold:
-            return "bl"
-        if abs(x - box.x2) < threshold and abs(y - box.y2) < threshold:
-            return "br"
-        
+        if near_t:
+            if near_l:
+                return "tl"
+            if near_r:
+                return "tr"
+        if near_b:
+            if near_l:
+                return "bl"
+            if near_r:
+                return "br"
+
         # edges
-        if abs(x - box.x1) < threshold and box.y1 <= y <= box.y2:
+        if near_l and y1 <= y <= y2:
             return "l"
-        if abs(x - box.x2) < threshold and box.y1 <= y <= box.y2:
+        if near_r and y1 <= y <= y2:
             return "r"
-        if abs(y - box.y1) < threshold and box.x1 <= x <= box.x2:
+        if near_t and x1 <= x <= x2:
             return "t"
-        if abs(y - box.y2) < threshold and box.x1 <= x <= box.x2:
+        if near_b and x1 <= x <= x2:
             return "b"
-        
+
         return None
 
-    def _resize_box(self, box: BoundingBox, handle: str, new_pos: QtCore.QPointF) -> None:
-        """Resize box based on which handle is being dragged."""
+    def _resize_box(self, box: BoundingBox, handle: str, x: float, y: float) -> None:
+        """Resize box based on which handle is being dragged to image point (x, y)."""
         if handle == "tl":
-            box.x1 = new_pos.x()
-            box.y1 = new_pos.y()
+            box.x1 = x
+            box.y1 = y
         elif handle == "tr":
-            box.x2 = new_pos.x()
-            box.y1 = new_pos.y()
+            box.x2 = x
+            box.y1 = y
         elif handle == "bl":
-            box.x1 = new_pos.x()
-            box.y2 = new_pos.y()
+            box.x1 = x
+            box.y2 = y
         elif handle == "br":
-            box.x2 = new_pos.x()
-            box.y2 = new_pos.y()
+            box.x2 = x
+            box.y2 = y
         elif handle == "l":
-            box.x1 = new_pos.x()
+            box.x1 = x
         elif handle == "r":
-            box.x2 = new_pos.x()
+            box.x2 = x
         elif handle == "t":
-            box.y1 = new_pos.y()
+            box.y1 = y
         elif handle == "b":
-            box.y2 = new_pos.y()
+            box.y2 = y
+
+    def _to_image_xy(self, px: float, py: float) -> Tuple[float, float]:
+        """Convert widget coordinates to image coordinates as plain floats."""
+        offset = self._offset
+        inv_scale = self._inv_scale
+        return (px - offset.x()) * inv_scale, (py - offset.y()) * inv_scale
 
     def _to_image_coords(self, point: QtCore.QPointF) -> QtCore.QPointF:
         """Convert widget coordinates to image coordinates."""
-        x = (point.x() - self._offset.x()) / self._scale
-        y = (point.y() - self._offset.y()) / self._scale
-        return QtCore.QPointF(x, y)
+        return QtCore.QPointF(*self._to_image_xy(point.x(), point.y()))
 
     def _set_crosshair_cursor(self) -> None:
         """Set a larger custom crosshair cursor for marking mode."""
@@ -0,0 +1,163 @@
+"""Background decoding of the images next to the one being edited.
+
+Navigation otherwise blocks on JPEG decoding and label parsing for every
+step. The prefetcher decodes neighbours on ``QThreadPool.globalInstance()``
+while the user is busy with the current image, so prev/next usually finds
+the pixels and labels already in memory.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+from PyQt6 import QtCore, QtGui
+
+from core.yolo_label_parser import read_yolo_labels_array
+from ui.canvas_widget import prepare_for_display
+
+
+class _PrefetchTask(QtCore.QRunnable):
+    def __init__(self, owner: "ImagePrefetcher", image_path: Path, label_path: Path, token: Tuple[int, int]):
+        super().__init__()
+        self._owner = owner
+        self._token = token
+        self._image_path = image_path
+        self._label_path = label_path
+
+    def run(self) -> None:
+        # QImage (unlike QPixmap) may be created off the GUI thread
+        image = QtGui.QImage(str(self._image_path))
+        if not image.isNull():
+            image = prepare_for_display(image)
+        rows: Optional[np.ndarray] = None
+        try:
+            if self._label_path.exists():
+                rows = read_yolo_labels_array(self._label_path)
+        except (OSError, ValueError):
+            rows = None
+        self._owner._store(self._image_path, self._label_path, image, rows, self._token)
+
+
+class ImagePrefetcher:
+    """LRU of decoded images and parsed label rows, bounded by memory use.
+
+    Entries are keyed by image path and remember which label file they were
+    read from, so a changed label folder never serves stale rows. Decoded
+    frames vary wildly in size (a 12 MP image is about 48 MB), so the bound
+    is on ``max_bytes`` rather than on the number of entries.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        # image path -> (label path, image, rows, bytes held)
+        self._entries: "OrderedDict[Path, Tuple[Path, QtGui.QImage, Optional[np.ndarray], int]]" = OrderedDict()
+        self._pending: set[Path] = set()
+        # in-flight results from before an invalidation are dropped instead
+        # of cached: clear() bumps the generation, discarding one path bumps
+        # only that path's counter so other neighbours keep decoding
+        self._generation = 0
+        self._path_tokens: dict[Path, int] = {}
+        self._lock = threading.Lock()
+
+    def schedule(self, items: Iterable[Tuple[Path, Path]]) -> None:
+        """Queue ``(image_path, label_path)`` pairs that aren't cached yet."""
+        pool = QtCore.QThreadPool.globalInstance()
+        for image_path, label_path in items:
+            with self._lock:
+                if image_path in self._entries or image_path in self._pending:
+                    continue
+                self._pending.add(image_path)
+                token = self._token_for(image_path)
+            pool.start(_PrefetchTask(self, image_path, label_path, token))
+
+    def get(self, image_path: Path, label_path: Path) -> Tuple[Optional[QtGui.QImage], Optional[np.ndarray]]:
+        """Return the cached ``(image, rows)`` for ``image_path``.
+
+        Either part is None when it has to be read from disk: on a miss, when
+        decoding failed, when there was no label file, or when the rows were
+        read from a different ``label_path``.
+        """
+        with self._lock:
+            entry = self._entries.get(image_path)
+            if entry is None:
+                return None, None
+            self._entries.move_to_end(image_path)
+        cached_label, image, rows, _ = entry
+        if image.isNull():
+            image = None
+        if cached_label != label_path:
+            rows = None
+        return image, rows
+
+    def put(self, image_path: Path, label_path: Path, image: QtGui.QImage) -> None:
+        """Cache an image decoded elsewhere; its label rows are read on demand."""
+        with self._lock:
+            token = self._token_for(image_path)
+        self._store(image_path, label_path, image, None, token)
+
+    def discard(self, image_path: Path) -> None:
+        """Forget ``image_path``, e.g. after its file was deleted."""
+        with self._lock:
+            entry = self._entries.pop(image_path, None)
+            if entry is not None:
+                self._bytes -= entry[3]
+            self._pending.discard(image_path)
+            self._bump(image_path)
+
+    def discard_labels(self, image_path: Path) -> None:
+        """Forget the label rows of ``image_path`` after its label file was rewritten.
+
+        The decoded image is kept; the rows are read again on the next visit.
+        """
+        with self._lock:
+            entry = self._entries.get(image_path)
+            if entry is not None and entry[2] is not None:
+                label_path, image, rows, size = entry
+                self._entries[image_path] = (label_path, image, None, size - rows.nbytes)
+                self._bytes -= rows.nbytes
+            # a decode in flight may have read the old file
+            self._pending.discard(image_path)
+            self._bump(image_path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._pending.clear()
+            self._path_tokens.clear()
+            self._generation += 1
+
+    def _token_for(self, image_path: Path) -> Tuple[int, int]:
+        # callers hold self._lock
+        return self._generation, self._path_tokens.get(image_path, 0)
+
+    def _bump(self, image_path: Path) -> None:
+        # callers hold self._lock
+        self._path_tokens[image_path] = self._path_tokens.get(image_path, 0) + 1
+
+    def _store(
+        self,
+        image_path: Path,
+        label_path: Path,
+        image: QtGui.QImage,
+        rows: Optional[np.ndarray],
+        token: Tuple[int, int],
+    ) -> None:
+        size = image.sizeInBytes() + (rows.nbytes if rows is not None else 0)
+        with self._lock:
+            self._pending.discard(image_path)
+            if token != self._token_for(image_path) or size > self._max_bytes:
+                return
+            old = self._entries.pop(image_path, None)
+            if old is not None:
+                self._bytes -= old[3]
+            self._entries[image_path] = (label_path, image, rows, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[3]
@@ -0,0 +1,136 @@
+"""Lightweight list models backing the Edit Mode side panels.
+
+The views only ask for the rows they paint, so nothing is formatted or
+allocated per row until it is actually shown.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from PyQt6 import QtCore
+
+from core.bbox_model import BoundingBox
+
+
+class BoxListModel(QtCore.QAbstractListModel):
+    """Shows a list of boxes as normalized YOLO rows, formatted on demand."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._boxes: List[BoundingBox] = []
+        self._image_size: Optional[Tuple[int, int]] = None
+        # rows the attached views currently know about; the referenced list
+        # may already have grown or shrunk when set_boxes() is called
+        self._row_count = 0
+        self._rows: dict[int, int] = {}
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._row_count
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        if role != QtCore.Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        if row >= len(self._boxes):
+            return None
+        box = self._boxes[row]
+        if not self._image_size:
+            return f"{box.class_id} 0.000000 0.000000 0.000000 0.000000"
+        width, height = self._image_size
+        x_center = (box.x1 + box.x2) / 2 / width
+        y_center = (box.y1 + box.y2) / 2 / height
+        w_norm = (box.x2 - box.x1) / width
+        h_norm = (box.y2 - box.y1) / height
+        return f"{box.class_id} {x_center:.6f} {y_center:.6f} {w_norm:.6f} {h_norm:.6f}"
+
+    def set_boxes(
+        self,
+        boxes: List[BoundingBox],
+        image_size: Optional[Tuple[int, int]],
+        changed: Optional[BoundingBox] = None,
+    ) -> None:
+        """Point the model at ``boxes`` and tell attached views to repaint.
+
+        The list is referenced, not copied. A reset is only needed when the
+        list or its length changes; otherwise only the row of ``changed`` is
+        re-queried, or every row when it isn't given.
+        """
+        if boxes is not self._boxes or len(boxes) != self._row_count or image_size != self._image_size:
+            self.beginResetModel()
+            self._boxes = boxes
+            self._image_size = image_size
+            self._row_count = len(boxes)
+            self._rows = {}
+            self.endResetModel()
+            return
+        row = self.row_of(changed) if changed is not None else -1
+        if row >= 0:
+            self.dataChanged.emit(self.index(row), self.index(row))
+        elif boxes:
+            self.dataChanged.emit(self.index(0), self.index(len(boxes) - 1))
+
+    def row_of(self, box: Optional[BoundingBox]) -> int:
+        """Return the row showing ``box`` (by identity), or -1.
+
+        Uses an id -> row map that is rebuilt only when it turns out stale,
+        so repeated lookups of the selected box don't scan the list.
+        """
+        if box is None:
+            return -1
+        row = self._rows.get(id(box), -1)
+        if 0 <= row < len(self._boxes) and self._boxes[row] is box:
+            return row
+        self._rows = {id(b): i for i, b in enumerate(self._boxes)}
+        return self._rows.get(id(box), -1)
+
+
+class SavedListModel(QtCore.QAbstractListModel):
+    """Ordered list of unique image names with O(1) membership checks."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names: List[str] = []
+        self._name_set: set[str] = set()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._names)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        if role != QtCore.Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        if index.row() >= len(self._names):
+            return None
+        return self._names[index.row()]
+
+    def add(self, name: str) -> bool:
+        """Append ``name`` unless already present; return whether it was added."""
+        if name in self._name_set:
+            return False
+        row = len(self._names)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._names.append(name)
+        self._name_set.add(name)
+        self.endInsertRows()
+        return True
+
+    def remove(self, name: str) -> bool:
+        """Remove ``name`` if present; return whether it was removed."""
+        if name not in self._name_set:
+            return False
+        row = self._names.index(name)
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self._names[row]
+        self._name_set.discard(name)
+        self.endRemoveRows()
+        return True
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._names.clear()
+        self._name_set.clear()
+        self.endResetModel()
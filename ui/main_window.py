@@ -28,6 +28,13 @@ class MainWindow(QtWidgets.QMainWindow):
         toolbar.addAction(self.edit_action)
         toolbar.addAction(self.shortcut_action)
         toolbar.addAction(self.copy_range_action)
+        # toolbar action to check for each mode widget class
+        self._mode_actions = {
+            "AutoLabelMode": self.auto_action,
+            "EditMode": self.edit_action,
+            "EditShortcutsMode": self.shortcut_action,
+            "CopyRangeMode": self.copy_range_action,
+        }
 
         # placeholders for modes
         # to be set by controller logic
@@ -36,11 +43,8 @@ class MainWindow(QtWidgets.QMainWindow):
         """Switch the central widget to the given mode widget."""
         index = self._central_widget.indexOf(widget)
         if index == -1:
-            self._central_widget.addWidget(widget)
-            index = self._central_widget.indexOf(widget)
+            index = self._central_widget.addWidget(widget)
         self._central_widget.setCurrentIndex(index)
-        class_name = widget.__class__.__name__
-        self.auto_action.setChecked(class_name == "AutoLabelMode")
-        self.edit_action.setChecked(class_name == "EditMode")
-        self.shortcut_action.setChecked(class_name == "EditShortcutsMode")
-        self.copy_range_action.setChecked(class_name == "CopyRangeMode")
+        active = self._mode_actions.get(widget.__class__.__name__)
+        for action in self._mode_actions.values():
+            action.setChecked(action is active)